@@ -6,10 +6,15 @@ This module provides functions for efficiently scanning directories and
 working with file paths across multiple scripts.
 """
 
+import ctypes
 import logging
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from collections import OrderedDict
+from itertools import islice
 from pathlib import Path
-from collections import defaultdict
-from typing import Union, Tuple, List, Optional
+from typing import Union, Tuple, List, Optional, Iterator, FrozenSet
 
 try:
     from tqdm import tqdm
@@ -20,11 +25,95 @@ except ImportError:
     def tqdm(iterable, **kwargs):
         return iterable
 
+try:
+    import liburing
+    HAS_LIBURING = True
+except ImportError:
+    HAS_LIBURING = False
+
+try:
+    # Optional Cython extension listing directories with raw getdents64
+    import _fastwalk
+    HAS_FASTWALK = True
+except ImportError:
+    HAS_FASTWALK = False
+
+try:
+    # glibc >= 2.28 wraps the statx(2) syscall; absent on other platforms
+    _libc_statx = ctypes.CDLL(None, use_errno=True).statx
+    _libc_statx.argtypes = [
+        ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.c_void_p
+    ]
+    _libc_statx.restype = ctypes.c_int
+    _libc_statfs = ctypes.CDLL(None, use_errno=True).statfs
+    _libc_statfs.argtypes = [ctypes.c_char_p, ctypes.c_void_p]
+    _libc_statfs.restype = ctypes.c_int
+    HAS_STATX = True
+except (OSError, AttributeError, TypeError):
+    HAS_STATX = False
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 PathLike = Union[Path, str]
 
+# (st_dev, ancestors) carried with each directory of a recursive walk, where
+# ancestors holds the (st_dev, st_ino) of every directory on its path
+_WalkContext = Tuple[Optional[int], FrozenSet[Tuple[Optional[int], int]]]
+
+# Recursive scans are bound by syscall latency rather than CPU, and scandir()
+# releases the GIL, so more threads than cores still helps
+_MAX_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Directories with more subdirectories than this are scanned on the thread pool
+_PARALLEL_SUBDIR_THRESHOLD = 4
+
+# Number of statx requests submitted per io_uring_enter() call
+_IOURING_BATCH_SIZE = 256
+
+# Directory entries consumed between progress bar updates
+_PROGRESS_BATCH_SIZE = 4096
+
+# statx(2) constants from <fcntl.h> and <linux/stat.h>
+_AT_FDCWD = -100
+_AT_SYMLINK_NOFOLLOW = 0x100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_SIZE = 0x200
+
+
+class _Statx(ctypes.Structure):
+    """Leading fields of struct statx, padded to the kernel's 256 bytes."""
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("_rest", ctypes.c_uint8 * 208),
+    ]
+
+
+class _Statfs(ctypes.Structure):
+    """Leading f_type field of struct statfs, padded past the struct's size."""
+    _fields_ = [
+        ("f_type", ctypes.c_long),
+        ("_rest", ctypes.c_uint8 * 248),
+    ]
+
+
+# statfs(2) f_type values from <linux/magic.h> for filesystems where every
+# stat() may be a server round trip: NFS, SMB, CIFS, SMB2, FUSE, Ceph, AFS
+# (both magics) and 9p
+_NETWORK_FS_MAGICS = frozenset([
+    0x6969, 0x517B, 0xFF534D42, 0xFE534D42, 0x65735546,
+    0x00C36400, 0x5346414F, 0x6B414653, 0x01021997,
+])
+
 class PathScanner:
     """
     Class-based interface for path scanning with state management and configuration.
@@ -38,7 +127,8 @@ class PathScanner:
         show_progress: bool = False,
         resolve_paths: bool = False,
         include_hidden: bool = True,
-        enable_cache: bool = True
+        enable_cache: bool = True,
+        cache_size: int = 1024
     ):
         """
         Initialize PathScanner with default settings.
@@ -48,14 +138,17 @@ class PathScanner:
             resolve_paths: Default path resolution setting
             include_hidden: Default hidden file inclusion setting
             enable_cache: Enable result caching
+            cache_size: Maximum number of cached scans (least recently used
+                are evicted first)
         """
         self.show_progress = show_progress
         self.resolve_paths = resolve_paths
         self.include_hidden = include_hidden
         self.enable_cache = enable_cache
+        self.cache_size = cache_size
         
         # State tracking
-        self._cache = {} if enable_cache else None
+        self._cache = OrderedDict() if enable_cache else None
         self._stats = {"scans": 0, "files_found": 0, "folders_found": 0, "cache_hits": 0}
         self._scan_history = []
         self._filters = []
@@ -86,12 +179,28 @@ class PathScanner:
         _resolve_paths = resolve_paths if resolve_paths is not None else self.resolve_paths
         _include_hidden = include_hidden if include_hidden is not None else self.include_hidden
         
-        # Check cache first
-        if self.enable_cache and use_cache and self._cache is not None:
-            cache_key = (str(Path(directory).resolve()), _resolve_paths, _include_hidden)
-            if cache_key in self._cache:
-                self._stats["cache_hits"] += 1
-                return self._cache[cache_key]
+        # Check cache first; the directory's mtime and size are part of the
+        # key so entries go stale as soon as the directory changes.
+        # (st_dev, st_ino) from the same stat() tells apart directories that
+        # share a relative path, without resolve() stat'ing every component.
+        cache_key = None
+        if self.enable_cache and self._cache is not None:
+            path = os.fspath(Path(directory))
+            try:
+                st = os.stat(path)
+            except OSError:
+                pass  # Let the scan below raise the appropriate error
+            else:
+                cache_key = (
+                    path, st.st_dev, st.st_ino,
+                    st.st_mtime_ns, st.st_size, _resolve_paths, _include_hidden
+                )
+        
+        if use_cache and cache_key is not None and cache_key in self._cache:
+            self._cache.move_to_end(cache_key)
+            self._stats["cache_hits"] += 1
+            files, folders = self._cache[cache_key]
+            return list(files), list(folders)
         
         # Perform scan using module function
         files, folders = scan_directory(
@@ -111,10 +220,12 @@ class PathScanner:
         self._stats["folders_found"] += len(folders)
         self._scan_history.append(directory)
         
-        # Cache results
-        if self.enable_cache and self._cache is not None:
-            cache_key = (str(Path(directory).resolve()), _resolve_paths, _include_hidden)
-            self._cache[cache_key] = (files, folders)
+        # Cache results as tuples so callers can't mutate the cached copy
+        if cache_key is not None:
+            self._cache[cache_key] = (tuple(files), tuple(folders))
+            self._cache.move_to_end(cache_key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
         
         return files, folders
     
@@ -250,6 +361,28 @@ class PathScanner:
         """Print scan results using module function."""
         print_scan_results(files, folders, directory)
 
+def _path_sort_key(path: str) -> List[str]:
+    """Sort key for path strings that orders them the way Path objects compare."""
+    return os.path.normcase(path).split(os.sep)
+
+
+def _sorted_paths(paths: List[str]) -> List[Path]:
+    """
+    Sort path strings in place and wrap them in Path objects.
+    
+    Sorting the strings with a precomputed key avoids both the copy made by
+    sorted() and a PurePath.__lt__ call per comparison.
+    
+    Args:
+        paths: Path strings to sort (modified in place)
+        
+    Returns:
+        Sorted list of Path objects
+    """
+    paths.sort(key=_path_sort_key)
+    return [Path(p) for p in paths]
+
+
 def scan_directory(
     directory: PathLike, 
     show_progress: bool = False,
@@ -275,50 +408,143 @@ def scan_directory(
     """
     path = Path(directory)
     
-    # Validation
-    if not path.exists():
-        raise FileNotFoundError(f"Directory '{directory}' does not exist")
-    if not path.is_dir():
-        raise NotADirectoryError(f"'{directory}' is not a directory")
+    # Plain listings go through the getdents64 extension when it is built
+    if HAS_FASTWALK and not (show_progress or resolve_paths):
+        files_out, folders_out = _scan_directory_fast(directory, include_hidden)
+        return _sorted_paths(files_out), _sorted_paths(folders_out)
     
-    # Use defaultdict to collect items by type
-    items = defaultdict(list)
+    # Opening the directory is the validation; no separate exists()/is_dir()
+    try:
+        it = os.scandir(path)
+    except OSError as e:
+        raise _directory_error(directory, e)
+    
+    files_out = []
+    folders_out = []
+    files_append = files_out.append
+    folders_append = folders_out.append
+    
+    # All non-symlink entries share this parent, so resolve it once rather than per entry
+    parent_resolved = str(path.resolve()) if resolve_paths else None
+    skip_hidden = not include_hidden
+    
+    pbar = None
+    if show_progress and HAS_TQDM:
+        pbar = tqdm(desc=f"Scanning {path.name}", unit="items")
+    elif show_progress and not HAS_TQDM:
+        logger.warning("tqdm not available, progress bar disabled")
     
     try:
-        # Create iterator with optional progress bar
-        iterator = path.iterdir()
-        if show_progress and HAS_TQDM:
-            iterator = tqdm(iterator, desc=f"Scanning {path.name}", unit="items")
-        elif show_progress and not HAS_TQDM:
-            logger.warning("tqdm not available, progress bar disabled")
-        
-        # Single iteration through directory
-        for item in iterator:
-            try:
-                # Skip hidden files if requested
-                if not include_hidden and item.name.startswith('.'):
+        # os.scandir gets the entry type from the directory listing itself,
+        # so classifying an entry doesn't cost a stat() call
+        with it:
+            # Progress is reported per batch, so the loop body stays free of tqdm
+            iterator = it if pbar is None else _progress_batches(it, pbar)
+            
+            # Single iteration through directory
+            for entry in iterator:
+                # Skip hidden files if requested; names are never empty, so
+                # indexing is safe and cheaper than a startswith() call
+                if skip_hidden and entry.name[0] == '.':
                     continue
                 
-                # Resolve path if requested
-                if resolve_paths:
-                    item = item.resolve()
+                # Classifying needs a stat() only for symlinks, or when the
+                # filesystem doesn't report d_type. Like Path.is_file() and
+                # the _fastwalk backend, an entry that can't be stat'ed is
+                # not a file, so it is listed as a folder.
+                try:
+                    is_file = entry.is_file()
+                    is_link = resolve_paths and entry.is_symlink()
+                except OSError:
+                    is_file = False
+                    is_link = False
                 
-                items[item.is_file()].append(item)
+                if not resolve_paths:
+                    item = entry.path
+                elif is_link:
+                    item = os.path.realpath(entry.path)
+                else:
+                    item = os.path.join(parent_resolved, entry.name)
                 
-            except (PermissionError, OSError) as e:
-                logger.warning(f"Skipping '{item}': {e}")
-                continue
+                if is_file:
+                    files_append(item)
+                else:
+                    folders_append(item)
         
     except PermissionError:
         raise PermissionError(f"Permission denied accessing '{directory}'")
+    finally:
+        if pbar is not None:
+            pbar.close()
     
-    # Extract files and folders (True key = files, False key = folders)
-    files = sorted(items[True])
-    folders = sorted(items[False])
+    files = _sorted_paths(files_out)
+    folders = _sorted_paths(folders_out)
     
     return files, folders
 
 
+def _progress_batches(iterable, pbar) -> Iterator:
+    """
+    Pass items through, advancing pbar once per _PROGRESS_BATCH_SIZE items.
+    
+    Args:
+        iterable: Items to yield
+        pbar: tqdm progress bar to advance
+        
+    Yields:
+        The items of iterable, in order
+    """
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, _PROGRESS_BATCH_SIZE))
+        if not batch:
+            return
+        yield from batch
+        pbar.update(len(batch))
+
+
+def _scan_directory_fast(directory: PathLike, include_hidden: bool) -> Tuple[List[str], List[str]]:
+    """
+    List a directory with the _fastwalk extension.
+    
+    Args:
+        directory: Path to directory to scan
+        include_hidden: Include hidden files/folders (starting with .)
+        
+    Returns:
+        Tuple of (files, folders) path string lists, unsorted
+        
+    Raises:
+        FileNotFoundError: If directory doesn't exist
+        NotADirectoryError: If path is not a directory
+        PermissionError: If permission denied
+    """
+    try:
+        # Normalise through Path like the scandir path does, so '' means '.'
+        listing = _fastwalk.listdir(os.fspath(Path(directory)), include_hidden)
+    except OSError as e:
+        raise _directory_error(directory, e)
+    
+    files_out = []
+    folders_out = []
+    files_append = files_out.append
+    folders_append = folders_out.append
+    dt_reg = _fastwalk.DT_REG
+    dt_lnk = _fastwalk.DT_LNK
+    dt_unknown = _fastwalk.DT_UNKNOWN
+    
+    for item, d_type in listing:
+        if d_type == dt_reg:
+            files_append(item)
+        elif d_type == dt_lnk or d_type == dt_unknown:
+            # Type not known from the listing; stat like DirEntry.is_file() would
+            (files_append if os.path.isfile(item) else folders_append)(item)
+        else:
+            folders_append(item)
+    
+    return files_out, folders_out
+
+
 def scan_directory_simple(directory: PathLike) -> Tuple[List[Path], List[Path]]:
     """
     Simple directory scan without extra features.
@@ -348,35 +574,273 @@ def scan_directory_recursive(
     Returns:
         Tuple of (all_files, all_folders) lists
     """
-    path = Path(directory)
-    
-    if not path.exists():
-        raise FileNotFoundError(f"Directory '{directory}' does not exist")
-    if not path.is_dir():
-        raise NotADirectoryError(f"'{directory}' is not a directory")
-    
     all_files = []
     all_folders = []
+    root = os.fspath(Path(directory))
     
-    def _scan_recursive(current_path: Path, current_depth: int = 0):
-        if max_depth is not None and current_depth > max_depth:
-            return
-            
+    # The bar advances once per scanned subtree rather than per entry
+    pbar = None
+    if show_progress and HAS_TQDM:
+        pbar = tqdm(desc=f"Scanning {Path(root).name}", unit="folders")
+    elif show_progress and not HAS_TQDM:
+        logger.warning("tqdm not available, progress bar disabled")
+    
+    try:
+        # Shallow trees are walked inline; the pool is only started once some
+        # directory fans out into enough subdirectories to be worth handing off
         try:
-            files, folders = scan_directory_simple(current_path)
-            all_files.extend(files)
-            all_folders.extend(folders)
-            
-            # Recurse into subdirectories
-            for folder in folders:
-                _scan_recursive(folder, current_depth + 1)
+            files, folders, pending = _scan_subtree(
+                root, 0, _root_context(root), max_depth, strict_root=True
+            )
+        except OSError as e:
+            raise _directory_error(directory, e)
+        all_files.extend(files)
+        all_folders.extend(folders)
+        if pbar is not None:
+            pbar.update(len(folders))
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=_MAX_SCAN_WORKERS) as executor:
+                futures = {
+                    executor.submit(_scan_subtree, subdir, depth, context, max_depth)
+                    for subdir, depth, context in pending
+                }
+                while futures:
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        files, folders, pending = future.result()
+                        all_files.extend(files)
+                        all_folders.extend(folders)
+                        if pbar is not None:
+                            pbar.update(len(folders))
+                        futures.update(
+                            executor.submit(_scan_subtree, subdir, depth, context, max_depth)
+                            for subdir, depth, context in pending
+                        )
+    finally:
+        if pbar is not None:
+            pbar.close()
+    
+    return _sorted_paths(all_files), _sorted_paths(all_folders)
+
+
+def iter_scan_recursive(
+    directory: PathLike,
+    max_depth: Optional[int] = None
+) -> Iterator[Tuple[Path, bool]]:
+    """
+    Recursively walk directory, yielding entries as they are found.
+    
+    Unlike scan_directory_recursive, nothing is collected or sorted, so
+    memory use doesn't grow with the size of the tree.
+    
+    Args:
+        directory: Root directory to scan
+        max_depth: Maximum recursion depth (None for unlimited)
+        
+    Yields:
+        Tuples of (path, is_file), in no particular order
+        
+    Raises:
+        FileNotFoundError: If directory doesn't exist
+        NotADirectoryError: If path is not a directory
+    """
+    try:
+        for item, name, is_file in _walk_str(os.fspath(Path(directory)), max_depth):
+            yield Path(item), is_file
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise _directory_error(directory, e)
+
+
+def _root_context(root: str) -> _WalkContext:
+    """Walk context for a walk's root directory: its st_dev and itself as sole ancestor."""
+    try:
+        st = os.stat(root)
+    except OSError:
+        return None, frozenset()  # Let the scan itself raise the appropriate error
+    return st.st_dev, frozenset([(st.st_dev, st.st_ino)])
+
+
+def _enter_dir(
+    entry: os.DirEntry,
+    context: _WalkContext
+) -> Optional[_WalkContext]:
+    """
+    Get the walk context for a subdirectory, or None if entering it would loop.
+    
+    A cycle needs a symlink back to a directory on the current path, so only
+    symlinks are checked: they are stat'ed through the link and skipped when
+    the target is one of the ancestors. Other symlinked directories are always
+    followed, so the result doesn't depend on listing order. Plain directories
+    are keyed on the parent's device and entry.inode(), which comes from the
+    listing without a stat() call. A mount point lists the inode of the
+    directory it covers, so keys below one may be off; that can let a looping
+    link be followed one extra level, never indefinitely.
+    
+    Args:
+        entry: Directory entry known to be a directory
+        context: (st_dev, ancestors) of the directory containing entry
+        
+    Returns:
+        (st_dev, ancestors) for the subdirectory, its own (st_dev, st_ino)
+        included in ancestors, or None if it should be skipped
+        
+    Raises:
+        OSError: If a symlink's target can't be stat'ed
+    """
+    dev, ancestors = context
+    if entry.is_symlink():
+        st = entry.stat()
+        key = (st.st_dev, st.st_ino)
+        if key in ancestors:
+            return None
+    else:
+        key = (dev, entry.inode())
+    
+    return key[0], ancestors | {key}
+
+
+def _scan_dir(
+    current: str,
+    context: _WalkContext,
+    descend: bool,
+    strict: bool
+) -> Iterator[Tuple[os.DirEntry, bool, Optional[_WalkContext]]]:
+    """
+    List one directory for the recursive walkers.
+    
+    This is the per-directory step shared by _walk_str() and _scan_subtree(),
+    so entry classification and error handling live in one place.
+    
+    Args:
+        current: Directory to list
+        context: (st_dev, ancestors) of current
+        descend: Whether subdirectories should be walked
+        strict: Raise instead of logging if current is missing or not
+            a directory
+        
+    Yields:
+        Tuples of (entry, is_file, child_context) where child_context is the
+        subdirectory's walk context if it should be walked, otherwise None
+        
+    Raises:
+        FileNotFoundError: If strict is set and current doesn't exist
+        NotADirectoryError: If strict is set and current is not a directory
+    """
+    try:
+        with os.scandir(current) as it:
+            for entry in it:
+                child_context = None
+                try:
+                    is_file = entry.is_file()
+                    if descend and not is_file and entry.is_dir():
+                        child_context = _enter_dir(entry, context)
+                except OSError:
+                    # Like Path.is_file(), an entry that can't be stat'ed
+                    # (ELOOP, EACCES) is not a file; keep listing the rest
+                    is_file = False
                 
-        except (PermissionError, OSError) as e:
-            logger.warning(f"Skipping '{current_path}': {e}")
+                yield entry, is_file, child_context
+                
+    except (PermissionError, OSError) as e:
+        if strict and isinstance(e, (FileNotFoundError, NotADirectoryError)):
+            raise
+        logger.warning(f"Skipping '{current}': {e}")
+
+
+def _walk_str(root: str, max_depth: Optional[int] = None) -> Iterator[Tuple[str, str, bool]]:
+    """
+    Recursively walk root using plain string paths.
+    
+    Paths are only wrapped in Path objects by the public callers, so
+    filtering on names here costs no Path construction. Symlinks back to
+    an ancestor directory are not followed, so cycles don't loop.
+    
+    Args:
+        root: Root directory to walk
+        max_depth: Maximum recursion depth (None for unlimited)
+        
+    Yields:
+        Tuples of (path, name, is_file), in no particular order
+        
+    Raises:
+        FileNotFoundError: If root doesn't exist
+        NotADirectoryError: If root is not a directory
+    """
+    stack = [(root, 0, _root_context(root))]
+    strict = True
     
-    _scan_recursive(path)
+    while stack:
+        current, depth, context = stack.pop()
+        descend = max_depth is None or depth < max_depth
+        for entry, is_file, child_context in _scan_dir(current, context, descend, strict):
+            if child_context is not None:
+                stack.append((entry.path, depth + 1, child_context))
+            
+            yield entry.path, entry.name, is_file
+        strict = False
+
+
+def _scan_subtree(
+    root: str,
+    root_depth: int,
+    root_context: _WalkContext,
+    max_depth: Optional[int],
+    strict_root: bool = False
+) -> Tuple[List[str], List[str], List[Tuple[str, int, _WalkContext]]]:
+    """
+    Walk the subtree under root, handing off wide directories.
+    
+    Directories with more than _PARALLEL_SUBDIR_THRESHOLD subdirectories
+    are not descended into here; they are returned so the caller can
+    schedule them on the thread pool.
+    
+    Args:
+        root: Directory to start from
+        root_depth: Depth of root relative to the top-level scan
+        root_context: (st_dev, ancestors) of root, see _enter_dir()
+        max_depth: Maximum recursion depth (None for unlimited)
+        strict_root: Raise instead of logging if root is missing or not
+            a directory
+        
+    Returns:
+        Tuple of (files, folders, handed_off) where handed_off is a list
+        of (directory, depth, context) tuples still to be scanned
+        
+    Raises:
+        FileNotFoundError: If strict_root is set and root doesn't exist
+        NotADirectoryError: If strict_root is set and root is not a directory
+    """
+    files = []
+    folders = []
+    handed_off = []
+    files_append = files.append
+    folders_append = folders.append
+    
+    # Iterative depth-first walk: one scandir() per directory, no recursion
+    stack = [(root, root_depth, root_context)]
+    strict = strict_root
+    
+    while stack:
+        current, depth, context = stack.pop()
+        descend = max_depth is None or depth < max_depth
+        children = []
+        for entry, is_file, child_context in _scan_dir(current, context, descend, strict):
+            if is_file:
+                files_append(entry.path)
+                continue
+            
+            folders_append(entry.path)
+            if child_context is not None:
+                children.append((entry.path, depth + 1, child_context))
+        strict = False
+        
+        if len(children) > _PARALLEL_SUBDIR_THRESHOLD:
+            handed_off.extend(children)
+        else:
+            stack.extend(children)
     
-    return sorted(all_files), sorted(all_folders)
+    return files, folders, handed_off
 
 
 def print_scan_results(files: List[Path], folders: List[Path], directory: PathLike) -> None:
@@ -437,18 +901,100 @@ def validate_directory(directory: PathLike) -> Path:
         NotADirectoryError: If path is not a directory
     """
     path = Path(directory)
+    try:
+        st = os.stat(path)
+    except OSError as e:
+        raise _directory_error(directory, e)
     
-    if not path.exists():
-        raise FileNotFoundError(f"Directory '{directory}' does not exist")
-    if not path.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         raise NotADirectoryError(f"'{directory}' is not a directory")
     
     return path
 
 
-def get_directory_size(directory: PathLike) -> int:
+def _directory_error(directory: PathLike, error: OSError) -> OSError:
     """
-    Get total size of directory in bytes.
+    Translate an OSError from opening a directory into this module's messages.
+    
+    Args:
+        directory: Directory that was being opened
+        error: Exception raised by the operating system
+        
+    Returns:
+        Exception to raise in its place
+    """
+    if isinstance(error, FileNotFoundError):
+        return FileNotFoundError(f"Directory '{directory}' does not exist")
+    if isinstance(error, NotADirectoryError):
+        return NotADirectoryError(f"'{directory}' is not a directory")
+    if isinstance(error, PermissionError):
+        return PermissionError(f"Permission denied accessing '{directory}'")
+    return error
+
+
+def _iter_nondir_entries(directory: PathLike) -> Iterator[os.DirEntry]:
+    """
+    Walk a directory tree, yielding every non-directory entry.
+    
+    Entry types come from the directory listing, so nothing is stat'ed
+    unless the filesystem doesn't report d_type. Symlinks are yielded
+    rather than followed.
+    
+    Args:
+        directory: Root directory to walk
+        
+    Yields:
+        Entries for files, symlinks and other non-directory entries
+    """
+    stack = [os.fspath(directory)]
+    
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        is_dir = False  # The caller's stat reports the error
+                    
+                    if is_dir:
+                        stack.append(entry.path)
+                    else:
+                        yield entry
+                        
+        except (PermissionError, OSError) as e:
+            logger.warning(f"Skipping '{current}': {e}")
+
+
+def _statx_size(path: str, buf: _Statx) -> int:
+    """
+    Get the size of path with a single statx(2) call.
+    
+    Only STATX_SIZE is requested and AT_STATX_DONT_SYNC lets network and
+    FUSE filesystems answer from their attribute cache instead of making
+    a round trip to the server.
+    
+    Args:
+        path: Path to stat (symlinks are not followed)
+        buf: Reusable statx buffer
+        
+    Returns:
+        Size in bytes
+        
+    Raises:
+        OSError: If the call fails
+    """
+    flags = _AT_SYMLINK_NOFOLLOW | _AT_STATX_DONT_SYNC
+    if _libc_statx(_AT_FDCWD, os.fsencode(path), flags, _STATX_SIZE, ctypes.byref(buf)):
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno), path)
+    return buf.stx_size
+
+
+def _directory_size_stat(directory: PathLike) -> int:
+    """
+    Get total size of directory with one DirEntry.stat() call per file.
     
     Args:
         directory: Directory to measure
@@ -456,24 +1002,211 @@ def get_directory_size(directory: PathLike) -> int:
     Returns:
         Total size in bytes
     """
-    path = validate_directory(directory)
     total_size = 0
     
-    try:
-        files, folders = scan_directory_recursive(path)
+    for entry in _iter_nondir_entries(directory):
+        try:
+            total_size += entry.stat(follow_symlinks=False).st_size
+        except (PermissionError, OSError) as e:
+            logger.warning(f"Skipping '{entry.path}': {e}")
+    
+    return total_size
+
+
+def _is_network_fs(path: PathLike) -> bool:
+    """
+    Check whether path lives on a network or FUSE filesystem.
+    
+    Args:
+        path: Path to check
         
-        for file in files:
-            try:
-                total_size += file.stat().st_size
-            except (OSError, PermissionError):
-                continue
-                
-    except (PermissionError, OSError) as e:
-        logger.warning(f"Could not calculate size for '{directory}': {e}")
+    Returns:
+        True if statfs(2) reports one of _NETWORK_FS_MAGICS, False otherwise
+        or if the call fails
+    """
+    buf = _Statfs()
+    if _libc_statfs(os.fsencode(path), ctypes.byref(buf)):
+        return False
+    # f_type is a signed long; mask so 32-bit builds compare the same way
+    return (buf.f_type & 0xFFFFFFFF) in _NETWORK_FS_MAGICS
+
+
+def _directory_size_statx(directory: PathLike) -> int:
+    """
+    Get total size of directory with one size-only statx(2) call per file.
+    
+    Args:
+        directory: Directory to measure
+        
+    Returns:
+        Total size in bytes
+    """
+    buf = _Statx()
+    total_size = 0
+    
+    for entry in _iter_nondir_entries(directory):
+        try:
+            total_size += _statx_size(entry.path, buf)
+        except (PermissionError, OSError) as e:
+            logger.warning(f"Skipping '{entry.path}': {e}")
+    
+    return total_size
+
+
+def _statx_batch(ring, cqe, paths: List[str]) -> List[Tuple[int, int]]:
+    """
+    Submit one statx request per path to the ring and reap the results.
+    
+    Args:
+        ring: Initialized liburing.Ring with room for len(paths) entries
+        cqe: liburing.Cqe used to reap completions
+        paths: Paths to stat (symlinks are not followed)
+        
+    Returns:
+        (res, size) per path, in order; res is the completion's result,
+        a negative errno on failure, and size is only valid when res >= 0
+    """
+    buffers = []
+    for index, file_path in enumerate(paths):
+        buf = liburing.Statx()
+        sqe = liburing.io_uring_get_sqe(ring)
+        liburing.io_uring_prep_statx(
+            sqe, buf, file_path,
+            liburing.AT_SYMLINK_NOFOLLOW | _AT_STATX_DONT_SYNC, liburing.STATX_SIZE
+        )
+        liburing.io_uring_sqe_set_data64(sqe, index)
+        buffers.append(buf)
+    
+    liburing.io_uring_submit_and_wait(ring, len(paths))
+    
+    results = [(0, 0)] * len(paths)
+    for _ in range(len(paths)):
+        liburing.io_uring_wait_cqe(ring, cqe)
+        completion = cqe[0]
+        index = liburing.io_uring_cqe_get_data64(completion)
+        res = completion.res
+        liburing.io_uring_cqe_seen(ring, completion)
+        results[index] = (res, buffers[index].size if res >= 0 else 0)
+    
+    return results
+
+
+def _statx_size_batch(ring, cqe, paths: List[str]) -> int:
+    """
+    Stat paths through the ring and sum the sizes.
+    
+    Args:
+        ring: Initialized liburing.Ring with room for len(paths) entries
+        cqe: liburing.Cqe used to reap completions
+        paths: Paths to stat (symlinks are not followed)
+        
+    Returns:
+        Total size in bytes of the paths that could be stat'ed
+    """
+    total_size = 0
+    for file_path, (res, size) in zip(paths, _statx_batch(ring, cqe, paths)):
+        if res < 0:
+            logger.warning(f"Skipping '{file_path}': {os.strerror(-res)}")
+        else:
+            total_size += size
     
     return total_size
 
 
+def _directory_size_iouring(directory: PathLike) -> int:
+    """
+    Get total size of directory using batched io_uring statx requests.
+    
+    Directories are still listed with os.scandir(), since mainline Linux has
+    no io_uring getdents operation; the per-file stat calls are what gets
+    batched, _IOURING_BATCH_SIZE requests per io_uring_enter() call.
+    
+    Args:
+        directory: Directory to measure
+        
+    Returns:
+        Total size in bytes
+        
+    Raises:
+        OSError: If an io_uring instance cannot be created, or the kernel
+            doesn't support IORING_OP_STATX (before Linux 5.6)
+    """
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    liburing.io_uring_queue_init(_IOURING_BATCH_SIZE, ring)
+    
+    try:
+        # Probe the op once on the directory itself; an unsupported op fails
+        # every request with EINVAL, which must fall back rather than be
+        # logged per file
+        [(res, _)] = _statx_batch(ring, cqe, [os.fspath(directory)])
+        if res < 0:
+            raise OSError(-res, os.strerror(-res), os.fspath(directory))
+        
+        total_size = 0
+        batch = []
+        
+        for entry in _iter_nondir_entries(directory):
+            batch.append(entry.path)
+            if len(batch) == _IOURING_BATCH_SIZE:
+                total_size += _statx_size_batch(ring, cqe, batch)
+                batch = []
+        
+        if batch:
+            total_size += _statx_size_batch(ring, cqe, batch)
+        
+        return total_size
+    
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+
+def get_directory_size(directory: PathLike) -> int:
+    """
+    Get total size of directory in bytes.
+    
+    Symlinks are counted by their own size and are not followed. Uses
+    batched io_uring statx requests when liburing is available. Otherwise,
+    directories on network or FUSE filesystems use size-only statx(2)
+    calls that may be answered from the attribute cache, and everything
+    else uses plain stat(), which is cheaper locally than a ctypes call.
+    
+    Args:
+        directory: Directory to measure
+        
+    Returns:
+        Total size in bytes
+    """
+    path = validate_directory(directory)
+    
+    if HAS_LIBURING:
+        try:
+            return _directory_size_iouring(path)
+        except OSError as e:
+            logger.debug(f"io_uring unavailable, falling back to scandir: {e}")
+    
+    # Only the root's filesystem is checked; mounts below it are not
+    if HAS_STATX and _is_network_fs(path):
+        return _directory_size_statx(path)
+    
+    return _directory_size_stat(path)
+
+
+def _normalize_extensions(extensions: Tuple[str, ...]) -> frozenset:
+    """
+    Normalize extensions to lowercase with a leading '.', as a set for O(1) lookup.
+    
+    Args:
+        extensions: Extensions with or without the leading dot (e.g., 'txt', '.PY')
+        
+    Returns:
+        Set of normalized extensions
+    """
+    return frozenset(
+        (ext if ext.startswith('.') else '.' + ext).lower() for ext in extensions
+    )
+
+
 def filter_by_extension(files: List[Path], *extensions: str) -> List[Path]:
     """
     Filter files by extension(s).
@@ -488,37 +1221,91 @@ def filter_by_extension(files: List[Path], *extensions: str) -> List[Path]:
     if not extensions:
         return files
     
-    # Normalize extensions (ensure they start with .)
-    normalized_exts = []
-    for ext in extensions:
-        if not ext.startswith('.'):
-            ext = '.' + ext
-        normalized_exts.append(ext.lower())
+    normalized_exts = _normalize_extensions(extensions)
     
     return [f for f in files if f.suffix.lower() in normalized_exts]
 
 
+def iter_files_matching(
+    directory: PathLike,
+    *extensions: str,
+    max_depth: Optional[int] = None
+) -> Iterator[Path]:
+    """
+    Recursively find files by extension(s), filtering during the walk.
+    
+    Equivalent to filter_by_extension over a recursive scan, but rejected
+    entries are never turned into Path objects or collected.
+    
+    Args:
+        directory: Root directory to scan
+        *extensions: Extensions to filter by (e.g., '.txt', '.py')
+        max_depth: Maximum recursion depth (None for unlimited)
+        
+    Yields:
+        Matching files, in no particular order
+        
+    Raises:
+        FileNotFoundError: If directory doesn't exist
+        NotADirectoryError: If path is not a directory
+    """
+    try:
+        for item in _iter_files_matching_str(os.fspath(Path(directory)), extensions, max_depth):
+            yield Path(item)
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise _directory_error(directory, e)
+
+
+def _iter_files_matching_str(
+    root: str,
+    extensions: Tuple[str, ...],
+    max_depth: Optional[int] = None
+) -> Iterator[str]:
+    """String-path core of iter_files_matching; see there for details."""
+    if not extensions:
+        for item, name, is_file in _walk_str(root, max_depth):
+            if is_file:
+                yield item
+        return
+    
+    normalized_exts = _normalize_extensions(extensions)
+    
+    for item, name, is_file in _walk_str(root, max_depth):
+        # Same rule as Path.suffix: the last dot, not leading and not trailing
+        dot = name.rfind('.')
+        if 0 < dot < len(name) - 1 and is_file and name[dot:].lower() in normalized_exts:
+            yield item
+
+
 # Convenience functions for common use cases
 def find_python_files(directory: PathLike, recursive: bool = False) -> List[Path]:
     """Find all Python files in directory."""
     if recursive:
-        files, _ = scan_directory_recursive(directory)
-    else:
-        files, _ = scan_directory_simple(directory)
+        return _find_files_recursive(directory, '.py')
     
+    files, _ = scan_directory_simple(directory)
     return filter_by_extension(files, '.py')
 
 
 def find_text_files(directory: PathLike, recursive: bool = False) -> List[Path]:
     """Find all text files in directory."""
     if recursive:
-        files, _ = scan_directory_recursive(directory)
-    else:
-        files, _ = scan_directory_simple(directory)
+        return _find_files_recursive(directory, '.txt', '.md', '.rst')
     
+    files, _ = scan_directory_simple(directory)
     return filter_by_extension(files, '.txt', '.md', '.rst')
 
 
+def _find_files_recursive(directory: PathLike, *extensions: str) -> List[Path]:
+    """Sorted list of files under directory matching extensions."""
+    try:
+        matches = list(_iter_files_matching_str(os.fspath(Path(directory)), extensions))
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise _directory_error(directory, e)
+    
+    return _sorted_paths(matches)
+
+
 # Example usage and testing
 if __name__ == "__main__":
     import argparse